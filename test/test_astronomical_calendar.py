@@ -218,6 +218,23 @@ class TestAstronomicalCalendar(unittest.TestCase):
         calc.geo_location = test_helper.daneborg()
         self.assertIsNone(calc.temporal_hour())
 
+    def test_sun_times_recalculated_after_changes(self):
+        calc = AstronomicalCalendar(geo_location=test_helper.lakewood(), date=date(2017, 10, 17))
+        self.assertEqual(calc.sunrise().replace(microsecond=0).isoformat(), "2017-10-17T07:09:11-04:00")
+        calc.date = date(2017, 10, 18)
+        self.assertEqual(calc.sunrise(), AstronomicalCalendar(test_helper.lakewood(), date(2017, 10, 18)).sunrise())
+        calc.geo_location.elevation = 500
+        expected = AstronomicalCalendar(test_helper.lakewood(), date(2017, 10, 18))
+        expected.geo_location.elevation = 500
+        self.assertEqual(calc.sunrise(), expected.sunrise())
+        self.assertNotEqual(calc.sunrise(), calc.sea_level_sunrise())
+        for setting, value in (('refraction', 0), ('solar_radius', 0), ('earth_radius', 6371.0)):
+            setattr(calc.astronomical_calculator, setting, value)
+            expected = AstronomicalCalendar(calc.geo_location, calc.date)
+            for name in ('refraction', 'solar_radius', 'earth_radius'):
+                setattr(expected.astronomical_calculator, name, getattr(calc.astronomical_calculator, name))
+            self.assertEqual(calc.sunrise(), expected.sunrise())
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
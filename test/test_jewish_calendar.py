@@ -1,5 +1,7 @@
+import copy
+import pickle
 import unittest
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 
 from dateutil import tz, parser
 
@@ -367,6 +369,62 @@ class TestJewishCalendar(unittest.TestCase):
         result = test.test_helper.specific_days_matching(all_days, expected.keys())
         self.assertEqual(result, expected)
 
+    def test_significant_day_reflects_changes_after_first_call(self):
+        calendar = JewishCalendar(5763, 1, 16)
+        self.assertEqual(calendar.significant_day(), 'pesach')
+        calendar.in_israel = True
+        self.assertEqual(calendar.significant_day(), 'chol_hamoed_pesach')
+        calendar.jewish_day = 14
+        self.assertEqual(calendar.significant_day(), 'erev_pesach')
+        calendar.back(2)
+        self.assertIsNone(calendar.significant_day())
+
+    def test_significant_day_after_copy_and_pickle(self):
+        calendar = JewishCalendar(5778, 7, 15)
+        for duplicate in (copy.copy(calendar), copy.deepcopy(calendar), pickle.loads(pickle.dumps(calendar))):
+            self.assertEqual(duplicate.significant_day(), 'succos')
+            self.assertTrue(duplicate.is_yom_tov())
+        calendar.significant_day()
+        self.assertEqual(copy.deepcopy(calendar).significant_day(), 'succos')
+        self.assertEqual(pickle.loads(pickle.dumps(calendar)).significant_day(), 'succos')
+
+    def test_significant_day_uses_subclass_month_helpers(self):
+        class ShevatCalendar(JewishCalendar):
+            def _shevat_significant_day(self):
+                return 'rosh_chodesh_shevat' if self.jewish_day == 1 else None
+
+        self.assertIsNone(JewishCalendar(5778, 11, 1).significant_day())
+        self.assertEqual(ShevatCalendar(5778, 11, 1).significant_day(), 'rosh_chodesh_shevat')
+        self.assertIsNone(ShevatCalendar(5778, 11, 15).significant_day())
+        self.assertEqual(JewishCalendar(5778, 11, 15).significant_day(), 'tu_beshvat')
+
+    def test_significant_day_with_year_dependent_subclass_helper(self):
+        class LegacyNissanCalendar(JewishCalendar):
+            def _nissan_significant_day(self):
+                if self.jewish_year < 5764 and self.jewish_day == 27:
+                    return 'yom_hashoah_observed'
+                return super()._nissan_significant_day()
+
+        self.assertEqual(LegacyNissanCalendar(5763, 1, 27).significant_day(), 'yom_hashoah_observed')
+        for year in (5764, 5766, 5778):
+            self.assertEqual(LegacyNissanCalendar(year, 1, 27).significant_day(),
+                             JewishCalendar(year, 1, 27).significant_day())
+
+    def test_significant_days_between(self):
+        start, end = date(2018, 9, 1), date(2019, 9, 1)
+        for in_israel in [False, True]:
+            result = JewishCalendar.significant_days_between(start, end, in_israel=in_israel, use_modern_holidays=True)
+            expected = []
+            for offset in range((end - start).days):
+                calendar = JewishCalendar(start + timedelta(days=offset))
+                calendar.in_israel = in_israel
+                calendar.use_modern_holidays = True
+                expected.append(calendar.significant_day())
+            self.assertEqual(result, expected)
+
+    def test_significant_days_between_empty_range(self):
+        self.assertEqual(JewishCalendar.significant_days_between(date(2018, 9, 1), date(2018, 9, 1)), [])
+
     def test_is_yom_tov_outside_israel(self):
         year = test.test_helper.leap_shabbos_shelaimim()
 
@@ -437,6 +495,12 @@ class TestJewishCalendar(unittest.TestCase):
 
         self.assertEqual(sorted(all_days), sorted(list(set().union(expected_yom_tov, expected_shabbosos))))
 
+    def test_assur_bemelacha_pair(self):
+        self.assertEqual(JewishCalendar.assur_bemelacha_pair(date(2019, 4, 19)), (False, True))
+        self.assertEqual(JewishCalendar.assur_bemelacha_pair(date(2019, 4, 20)), (True, True))
+        self.assertEqual(JewishCalendar.assur_bemelacha_pair(date(2019, 4, 20), in_israel=True), (True, False))
+        self.assertEqual(JewishCalendar.assur_bemelacha_pair(date(2019, 4, 22)), (False, False))
+
     def test_is_assur_bemelacha_in_israel(self):
         year = test.test_helper.leap_shabbos_shelaimim()
 
@@ -890,6 +954,13 @@ class TestJewishCalendar(unittest.TestCase):
         expected_molad = datetime(2015, 10, 13, 0, 0, 0, tzinfo=tz.UTC) + timedelta(microseconds=total_microseconds)
         self.assertEqual(calendar.molad_as_datetime(), expected_molad)
 
+    def test_molad_as_datetime_follows_date_changes(self):
+        calendar = JewishCalendar(5776, 8, 1)
+        first_molad = calendar.molad_as_datetime()
+        calendar.jewish_month = 9
+        self.assertEqual(calendar.molad_as_datetime(), JewishCalendar(5776, 9, 1).molad_as_datetime())
+        self.assertNotEqual(calendar.molad_as_datetime(), first_molad)
+
     def test_sof_zman_kiddush_levana_between_moldos(self):
         calendar = JewishCalendar(5776, 8, 1)
         next_month = JewishCalendar(5776, 9, 1)
@@ -639,6 +639,10 @@ class TestJewishDate(unittest.TestCase):
         result = map(lambda name: subject.jewish_month_from_name(name), month_names)
         self.assertEqual(list(result), list(range(1, 14)))
 
+    def test_jewish_month_from_name_with_invalid_name(self):
+        with self.assertRaisesRegex(ValueError, "invalid month name 'tishri'"):
+            JewishDate().jewish_month_from_name('tishri')
+
     def test_jewish_month_name(self):
         subject = JewishDate()
         self.assertEqual(subject.jewish_month_name(3), 'sivan')
@@ -1,3 +1,5 @@
+import copy
+import pickle
 import unittest
 from datetime import date, timedelta
 
@@ -8,6 +10,19 @@ from zmanim.zmanim_calendar import ZmanimCalendar
 
 
 class TestZmanimCalendar(unittest.TestCase):
+    def test_compute_zmanim_range(self):
+        dates = [date(2017, 10, 17) + timedelta(days=offset) for offset in range(7)]
+        zmanim = ['hanetz', 'sof_zman_shma_mga', 'candle_lighting', 'tzais']
+        result = ZmanimCalendar.compute_zmanim_range(dates, test_helper.lakewood(), zmanim, candle_lighting_offset=40)
+        for name in zmanim:
+            expected = [getattr(ZmanimCalendar(40, geo_location=test_helper.lakewood(), date=d), name)() for d in dates]
+            self.assertEqual(result[name], expected)
+
+    def test_compute_zmanim_range_using_elevation(self):
+        dates = [date(2017, 10, 17), date(2017, 10, 18)]
+        result = ZmanimCalendar.compute_zmanim_range(dates, test_helper.lakewood(), ['hanetz'], use_elevation=True)
+        self.assertEqual(result['hanetz'], [ZmanimCalendar(geo_location=test_helper.lakewood(), date=d).sunrise() for d in dates])
+
     def test_hanetz(self):
         calendar = ZmanimCalendar(geo_location=test_helper.lakewood(), date=date(2017, 10, 17))
         self.assertEqual(calendar.hanetz(), calendar.sea_level_sunrise())
@@ -74,6 +89,18 @@ class TestZmanimCalendar(unittest.TestCase):
         calendar = ZmanimCalendar(geo_location=test_helper.lakewood(), date=date(2017, 10, 17))
         self.assertEqual(calendar.sof_zman_shma_mga().replace(microsecond=0).isoformat(), "2017-10-17T09:19:53-04:00")
 
+    def test_mga_zmanim_use_alos_and_tzais_72_overrides(self):
+        class NinetyMinuteMgaCalendar(ZmanimCalendar):
+            def alos_72(self):
+                return self._alos_offset_minutes(90)
+
+            def tzais_72(self):
+                return self._tzais_offset_minutes(90)
+
+        calendar = NinetyMinuteMgaCalendar(geo_location=test_helper.lakewood(), date=date(2017, 10, 17))
+        self.assertEqual(calendar.sof_zman_shma_mga(), calendar.sof_zman_shma(calendar.alos_72(), calendar.tzais_72()))
+        self.assertEqual(calendar.sof_zman_tfila_mga(), calendar.sof_zman_tfila(calendar.alos_72(), calendar.tzais_72()))
+
     def test_sof_zman_tfila(self):
         calendar = ZmanimCalendar(geo_location=test_helper.lakewood(), date=date(2017, 10, 17))
         day_start = calendar.sunrise_offset_by_degrees(96)
@@ -100,6 +127,40 @@ class TestZmanimCalendar(unittest.TestCase):
         calendar = ZmanimCalendar(geo_location=test_helper.lakewood(), date=date(2017, 10, 17))
         self.assertEqual(calendar.plag_hamincha().replace(microsecond=0).isoformat(), "2017-10-17T17:04:48-04:00")
 
+    def test_zmanim_of_day(self):
+        calendar = ZmanimCalendar(geo_location=test_helper.lakewood(), date=date(2017, 10, 17))
+        result = {name: zman.replace(microsecond=0).isoformat() for name, zman in calendar.zmanim_of_day().items()}
+        self.assertEqual(result, {'sof_zman_shma_gra': "2017-10-17T09:55:53-04:00",
+                                  'sof_zman_tfila_gra': "2017-10-17T10:51:14-04:00",
+                                  'mincha_gedola': "2017-10-17T13:09:35-04:00",
+                                  'mincha_ketana': "2017-10-17T15:55:37-04:00",
+                                  'plag_hamincha': "2017-10-17T17:04:48-04:00"})
+
+    def test_zmanim_of_day_follows_use_elevation(self):
+        calendar = ZmanimCalendar(geo_location=test_helper.lakewood(), date=date(2017, 10, 17))
+        sea_level = calendar.zmanim_of_day()
+        calendar.use_elevation = True
+        self.assertEqual(calendar.zmanim_of_day()['mincha_gedola'],
+                         calendar.mincha_gedola(calendar.sunrise(), calendar.sunset()))
+        self.assertNotEqual(calendar.zmanim_of_day(), sea_level)
+
+    def test_copy_follows_its_own_date(self):
+        calendar = ZmanimCalendar(geo_location=test_helper.lakewood(), date=date(2017, 10, 17))
+        calendar.hanetz()
+        calendar_copy = copy.copy(calendar)
+        calendar_copy.date = date(2017, 6, 17)
+        expected = ZmanimCalendar(geo_location=test_helper.lakewood(), date=date(2017, 6, 17))
+        self.assertEqual(calendar_copy.hanetz(), expected.hanetz())
+        self.assertEqual(calendar_copy.sof_zman_shma_gra(), expected.sof_zman_shma_gra())
+        self.assertEqual(calendar.hanetz(), ZmanimCalendar(geo_location=test_helper.lakewood(), date=date(2017, 10, 17)).hanetz())
+
+    def test_pickle_round_trip(self):
+        calendar = ZmanimCalendar(geo_location=test_helper.lakewood(), date=date(2017, 10, 17))
+        calendar.hanetz()
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            self.assertEqual(pickle.loads(pickle.dumps(calendar, protocol)).hanetz(), calendar.hanetz())
+        self.assertEqual(vars(calendar)['candle_lighting_offset'], 18)
+
     def test_candle_lighting(self):
         calendar = ZmanimCalendar(geo_location=test_helper.lakewood(), date=date(2017, 10, 17))
         self.assertEqual(calendar.candle_lighting().replace(microsecond=0).isoformat(), "2017-10-17T17:55:58-04:00")
@@ -309,6 +370,16 @@ class TestZmanimCalendar(unittest.TestCase):
         self.assertTrue(calendar.is_assur_bemelacha(tzais - timedelta(seconds=2), {'degrees': 11.5}))
         self.assertFalse(calendar.is_assur_bemelacha(tzais + timedelta(seconds=2), {'degrees': 11.5}))
 
+    def test_assur_bemelacha_with_custom_tzais_rule_uses_tzais_override(self):
+        class LateTzaisCalendar(ZmanimCalendar):
+            def tzais(self, opts=None):
+                return super().tzais(opts) + timedelta(minutes=10)
+
+        calendar = LateTzaisCalendar(geo_location=test_helper.lakewood(), date=parser.parse('2017-10-21'))
+        tzais = calendar.tzais({'degrees': 0, 'offset': 50})
+        self.assertTrue(calendar.is_assur_bemelacha(tzais - timedelta(seconds=2), {'degrees': 0, 'offset': 50}))
+        self.assertFalse(calendar.is_assur_bemelacha(tzais + timedelta(seconds=2), {'degrees': 0, 'offset': 50}))
+
     def test_assur_bemelacha_prior_to_issur_melacha_day(self):
         date = '2017-10-20'
         calendar = ZmanimCalendar(geo_location=test_helper.lakewood(), date=parser.parse(date))
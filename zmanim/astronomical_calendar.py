@@ -27,28 +27,44 @@ class AstronomicalCalendar(MathHelper):
         self.geo_location = geo_location
         self.date = date
         self.astronomical_calculator = calculator
+        self.__solar_cache_state = None
+        self.__solar_cache = {}
 
     def __repr__(self):
         return "%s(geo_location=%r, date=%r, calculator=%r)" % \
                (self.__module__ + "." + self.__class__.__qualname__, self.geo_location, self.date, self.astronomical_calculator)
 
     def sunrise(self) -> Optional[datetime]:
-        return self._date_time_from_time_of_day(self.utc_sunrise(self.GEOMETRIC_ZENITH), 'sunrise')
+        cache = self._solar_cache()
+        if 'sunrise' not in cache:
+            cache['sunrise'] = self._date_time_from_time_of_day(self.utc_sunrise(self.GEOMETRIC_ZENITH), 'sunrise')
+        return cache['sunrise']
 
     def sea_level_sunrise(self) -> Optional[datetime]:
         return self.sunrise_offset_by_degrees(self.GEOMETRIC_ZENITH)
 
     def sunrise_offset_by_degrees(self, offset_zenith: float) -> Optional[datetime]:
-        return self._date_time_from_time_of_day(self.utc_sea_level_sunrise(offset_zenith), 'sunrise')
+        cache = self._solar_cache()
+        key = ('sunrise', offset_zenith)
+        if key not in cache:
+            cache[key] = self._date_time_from_time_of_day(self.utc_sea_level_sunrise(offset_zenith), 'sunrise')
+        return cache[key]
 
     def sunset(self) -> Optional[datetime]:
-        return self._date_time_from_time_of_day(self.utc_sunset(self.GEOMETRIC_ZENITH), 'sunset')
+        cache = self._solar_cache()
+        if 'sunset' not in cache:
+            cache['sunset'] = self._date_time_from_time_of_day(self.utc_sunset(self.GEOMETRIC_ZENITH), 'sunset')
+        return cache['sunset']
 
     def sea_level_sunset(self) -> Optional[datetime]:
         return self.sunset_offset_by_degrees(self.GEOMETRIC_ZENITH)
 
     def sunset_offset_by_degrees(self, offset_zenith: float) -> Optional[datetime]:
-        return self._date_time_from_time_of_day(self.utc_sea_level_sunset(offset_zenith), 'sunset')
+        cache = self._solar_cache()
+        key = ('sunset', offset_zenith)
+        if key not in cache:
+            cache[key] = self._date_time_from_time_of_day(self.utc_sea_level_sunset(offset_zenith), 'sunset')
+        return cache[key]
 
     def utc_sunrise(self, zenith: float) -> Optional[float]:
         return self.astronomical_calculator.utc_sunrise(self._adjusted_date(), self.geo_location, zenith, adjust_for_elevation=True)
@@ -85,6 +101,18 @@ class AstronomicalCalendar(MathHelper):
         noon_hour = (temporal_hour / self.HOUR_MILLIS) * 6.0
         return sunrise + timedelta(noon_hour / 24.0)
 
+    # Returns the cache of computed sun times, discarding it whenever the date, location or calculator has changed
+    # (including in-place changes to the location or the calculator settings)
+    def _solar_cache(self) -> dict:
+        geo = self.geo_location
+        calc = self.astronomical_calculator
+        state = (self.date, geo.latitude, geo.longitude, geo.elevation, geo.time_zone,
+                 calc, calc.refraction, calc.solar_radius, calc.earth_radius)
+        if state != self.__solar_cache_state:
+            self.__solar_cache_state = state
+            self.__solar_cache = {}
+        return self.__solar_cache
+
     def _date_time_from_time_of_day(self, time_of_day: Optional[float], mode: str) -> Optional[datetime]:
         if time_of_day is None:
             return None
@@ -1,12 +1,52 @@
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from enum import Enum
-from typing import Optional
+from functools import lru_cache
+from typing import List, Optional, Tuple
 
 from dateutil import tz
 
 from zmanim.hebrew_calendar.jewish_date import JewishDate
 from zmanim.util.geo_location import GeoLocation
 
+_YOM_TOV_ASSUR_BEMELACHA = frozenset(['pesach', 'shavuos', 'rosh_hashana', 'yom_kippur',
+                                      'succos', 'shemini_atzeres', 'simchas_torah'])
+_TAANIYOS = frozenset(['seventeen_of_tammuz', 'tisha_beav', 'tzom_gedalyah',
+                       'yom_kippur', 'tenth_of_teves', 'taanis_esther'])
+
+# significant days shared across instances, keyed by every input the month lookups depend on:
+# (month, day, day_of_week, is_leap_adar, in_israel, use_modern_holidays, is_short_kislev_teves)
+_SIGNIFICANT_DAY_TABLE = {}
+
+# whether each class uses JewishCalendar's own significant day helpers, and so may share _SIGNIFICANT_DAY_TABLE
+_USES_SIGNIFICANT_DAY_TABLE = {}
+
+# the molad is reckoned in local mean time at Har Habayis
+_HAR_HABAYIS = GeoLocation('Jerusalem, Israel', 31.778, 35.2354, tz.gettz('Asia/Jerusalem'))
+_JERUSALEM_STANDARD_TIME = tz.gettz('Etc/GMT-2')
+_HAR_HABAYIS_LOCAL_MEAN_TIME_OFFSET = timedelta(microseconds=_HAR_HABAYIS.local_mean_time_offset() * 1000)
+
+_THREE_DAYS = timedelta(3)
+_SEVEN_DAYS = timedelta(7)
+_FIFTEEN_DAYS = timedelta(15)
+
+
+def _day_mask(*days: int) -> int:
+    return sum(1 << day for day in days)
+
+
+# bitmask with one bit per (day * 8 + day_of_week), matching a fast that falls on the given day
+# unless that day is shabbos, in which case it is observed on the given alternate day and weekday
+def _fast_day_mask(day: int, observed_day: int, observed_day_of_week: int) -> int:
+    return sum(1 << (day * 8 + day_of_week) for day_of_week in range(1, 7)) | \
+        (1 << (observed_day * 8 + observed_day_of_week))
+
+
+_TZOM_GEDALYAH = _fast_day_mask(3, 4, 1)
+_SEVENTEEN_OF_TAMMUZ = _fast_day_mask(17, 18, 1)
+_TISHA_BEAV = _fast_day_mask(9, 10, 1)
+_TAANIS_ESTHER = _fast_day_mask(13, 11, 5)
+_TAANIS_BECHORIM = _fast_day_mask(14, 12, 5)
+
 
 class JewishCalendar(JewishDate):
     SIGNIFICANT_DAYS = Enum('SignificantDays', 'erev_rosh_hashana rosh_hashana tzom_gedalyah erev_yom_kippur yom_kippur \
@@ -17,46 +57,126 @@ class JewishCalendar(JewishDate):
                                                 seventeen_of_tammuz tisha_beav tu_beav \
                                                 yom_hashoah yom_hazikaron yom_haatzmaut yom_yerushalayim')
 
+    # significant days classified once, so the predicates below are a single set lookup
+    _YOM_TOV_DAYS = frozenset(d.name for d in SIGNIFICANT_DAYS
+                              if not d.name.startswith('erev_') and (d.name not in _TAANIYOS or d.name == 'yom_kippur'))
+    _EREV_YOM_TOV_DAYS = frozenset(d.name for d in SIGNIFICANT_DAYS
+                                   if d.name.startswith('erev_') or d.name == 'hoshana_rabbah')
+    _CHOL_HAMOED_DAYS = frozenset(d.name for d in SIGNIFICANT_DAYS
+                                  if d.name.startswith('chol_hamoed_') or d.name == 'hoshana_rabbah')
+
+    # diaspora-only second days (and their eves), as bitmasks of the day of month indexed by month number
+    _YOM_TOV_SHENI_DAYS = (0, _day_mask(16, 22), 0, _day_mask(7), 0, 0, 0, _day_mask(16, 23), 0, 0, 0, 0, 0, 0)
+    _EREV_YOM_TOV_SHENI_DAYS = (0, _day_mask(15, 21), 0, _day_mask(6), 0, 0, 0, _day_mask(15, 22), 0, 0, 0, 0, 0, 0)
+
+    # yom tov and chanukah days, as bitmasks of the day of month
+    _PESACH_DAYS = _day_mask(15, 16, 21, 22)
+    _PESACH_DAYS_IN_ISRAEL = _day_mask(15, 21)
+    _SHAVUOS_DAYS = _day_mask(6, 7)
+    _SHAVUOS_DAYS_IN_ISRAEL = _day_mask(6)
+    _SUCCOS_DAYS = _day_mask(15, 16)
+    _SUCCOS_DAYS_IN_ISRAEL = _day_mask(15)
+    _CHANUKAH_TEVES_DAYS = _day_mask(1, 2)
+    _CHANUKAH_TEVES_DAYS_AFTER_SHORT_KISLEV = _day_mask(1, 2, 3)
+
+    # a chelek is 10/3 seconds
+    _HALF_MOLAD_SECONDS = JewishDate.CHALAKIM_PER_MONTH * 10 / 6.0
+
     def __init__(self, *args, **kwargs):
         in_israel = None
-        if 'in_israel' in kwargs:
+        if kwargs and 'in_israel' in kwargs:
             in_israel = kwargs.pop('in_israel')
         if len(args) == 4:
             super(JewishCalendar, self).__init__(*args[:3], **kwargs)
             in_israel = args[3]
         else:
             super(JewishCalendar, self).__init__(*args, **kwargs)
-        self.in_israel = False if in_israel is None else in_israel
-        self.use_modern_holidays = False
+        # date initialization has already reset any cached values, so bypass the property setters
+        self.__in_israel = False if in_israel is None else in_israel
+        self.__use_modern_holidays = False
 
     def __repr__(self):
         return "<%s in_israel=%r, gregorian_date=%r, jewish_date=%r, day_of_week=%r, molad_hours=%r, molad_minutes=%r, molad_chalakim=%r>" % \
                (self.__module__ + "." + self.__class__.__qualname__, self.in_israel, self.gregorian_date,
                 self.jewish_date, self.day_of_week, self.molad_hours, self.molad_minutes, self.molad_chalakim)
 
+    @property
+    def in_israel(self) -> bool:
+        return self.__in_israel
+
+    @in_israel.setter
+    def in_israel(self, in_israel: bool):
+        self.__in_israel = in_israel
+        self._reset_cached_values()
+
+    @property
+    def use_modern_holidays(self) -> bool:
+        return self.__use_modern_holidays
+
+    @use_modern_holidays.setter
+    def use_modern_holidays(self, use_modern_holidays: bool):
+        self.__use_modern_holidays = use_modern_holidays
+        self._reset_cached_values()
+
     def significant_day(self) -> Optional[str]:
-        return getattr(self, f'_{self.jewish_month_name()}_significant_day', None)()
+        if not self.__significant_day_cached:
+            m = self.jewish_month
+            if self._uses_significant_day_table():
+                # year type only matters for adar (leap year) and teves (short kislev), skip computing it otherwise
+                key = (m, self.jewish_day, self.day_of_week, m == 12 and self.is_jewish_leap_year(),
+                       self.in_israel, self.use_modern_holidays, m == 10 and self.is_kislev_short())
+                try:
+                    significant_day = _SIGNIFICANT_DAY_TABLE[key]
+                except KeyError:
+                    significant_day = _SIGNIFICANT_DAY_TABLE[key] = getattr(self, self._SIGNIFICANT_DAY_HELPERS[m])()
+            else:
+                # an overridden helper may depend on state outside the table key, so only cache per instance
+                significant_day = getattr(self, self._SIGNIFICANT_DAY_HELPERS[m])()
+            self.__significant_day = significant_day
+            self.__significant_day_cached = True
+        return self.__significant_day
+
+    # Returns the significant day (or None) of each date from start up to, but not including, end
+    #   JewishCalendar.significant_days_between(date(2018, 3, 30), date(2018, 4, 2))
+    #   => ['erev_pesach', 'pesach', 'pesach']
+    @classmethod
+    def significant_days_between(cls, start: date, end: date, in_israel: bool = False,
+                                 use_modern_holidays: bool = False) -> List[Optional[str]]:
+        calendar = cls(start)
+        calendar.in_israel = in_israel
+        calendar.use_modern_holidays = use_modern_holidays
+        significant_days = []
+        for _ in range((end - start).days):
+            significant_days.append(calendar.significant_day())
+            calendar.forward()
+        return significant_days
 
     def significant_shabbos(self) -> Optional[str]:
         if self.day_of_week != 7:
             return None
-        if self.jewish_month == 1:
-            if self.jewish_day == 1:
+        m = self.jewish_month
+        mjy = self.months_in_jewish_year()
+        # only nissan, tishrei and the last two months of the year have special shabbosos
+        if m not in (1, 7, mjy - 1, mjy):
+            return None
+        d = self.jewish_day
+        if m == 1:
+            if d == 1:
                 return 'parshas_hachodesh'
-            elif self.jewish_day in range(8, 15):
+            elif 8 <= d < 15:
                 return 'shabbos_hagadol'
-        elif self.jewish_month == 7 and self.jewish_day in range(3, 10):
+        elif m == 7 and 3 <= d < 10:
             return 'shabbos_shuva'
-        elif self.jewish_month == (self.months_in_jewish_year() - 1) and self.jewish_day in range(25, 31):
+        elif m == (mjy - 1) and 25 <= d < 31:
             return 'parshas_shekalim'
-        elif self.jewish_month == self.months_in_jewish_year():
-            if self.jewish_day == 1:
+        elif m == mjy:
+            if d == 1:
                 return 'parshas_shekalim'
-            elif self.jewish_day in range(7, 14):
+            elif 7 <= d < 14:
                 return 'parshas_zachor'
-            elif self.jewish_day in range(17, 24):
+            elif 17 <= d < 24:
                 return 'parshas_parah'
-            elif self.jewish_day in range(24, 30):
+            elif 24 <= d < 30:
                 return 'parshas_hachodesh'
 
     def is_assur_bemelacha(self) -> bool:
@@ -65,6 +185,14 @@ class JewishCalendar(JewishDate):
     def is_tomorrow_assur_bemelacha(self) -> bool:
         return self.day_of_week == 6 or self.is_erev_yom_tov() or self.is_erev_yom_tov_sheni()
 
+    # Returns (is_assur_bemelacha(), is_tomorrow_assur_bemelacha()) for the given date, from a single Hebrew date conversion
+    @classmethod
+    @lru_cache(maxsize=400)
+    def assur_bemelacha_pair(cls, day: date, in_israel: bool = False) -> Tuple[bool, bool]:
+        calendar = cls(day)
+        calendar.in_israel = in_israel
+        return calendar.is_assur_bemelacha(), calendar.is_tomorrow_assur_bemelacha()
+
     def has_candle_lighting(self) -> bool:
         return self.is_tomorrow_assur_bemelacha()
 
@@ -72,51 +200,42 @@ class JewishCalendar(JewishDate):
         return self.day_of_week != 6 and self.has_candle_lighting() and self.is_assur_bemelacha()
 
     def is_yom_tov(self) -> bool:
-        sd = self.significant_day()
-        return sd is not None \
-            and not sd.startswith('erev_') \
-            and (not self.is_taanis() or sd == 'yom_kippur')
+        return self.significant_day() in self._YOM_TOV_DAYS
 
     def is_yom_tov_assur_bemelacha(self) -> bool:
-        return self.significant_day() in ['pesach', 'shavuos', 'rosh_hashana', 'yom_kippur',
-                                          'succos', 'shemini_atzeres', 'simchas_torah']
+        return self.significant_day() in _YOM_TOV_ASSUR_BEMELACHA
 
     def is_erev_yom_tov(self) -> bool:
         sd = self.significant_day()
-        return sd is not None and (sd.startswith('erev_')
-                                   or sd == 'hoshana_rabbah'
-                                   or (sd == 'chol_hamoed_pesach' and self.jewish_day == 20))
+        return sd in self._EREV_YOM_TOV_DAYS or (sd == 'chol_hamoed_pesach' and self.jewish_day == 20)
 
     def is_yom_tov_sheni(self) -> bool:
-        return ((self.jewish_month == 7 and self.jewish_day == 2)
-                or (not self.in_israel and (
-                    (self.jewish_month == 7 and self.jewish_day in [16, 23]) or
-                    (self.jewish_month == 1 and self.jewish_day in [16, 22]) or
-                    (self.jewish_month == 3 and self.jewish_day == 7)
-                )))
+        m, d = self.jewish_month, self.jewish_day
+        if m == 7 and d == 2:
+            return True
+        if self.in_israel:
+            return False
+        return bool((self._YOM_TOV_SHENI_DAYS[m] >> d) & 1)
 
     def is_erev_yom_tov_sheni(self) -> bool:
-        return ((self.jewish_month == 7 and self.jewish_day == 1)
-                or (not self.in_israel and (
-                    (self.jewish_month == 7 and self.jewish_day in [15, 22]) or
-                    (self.jewish_month == 1 and self.jewish_day in [15, 21]) or
-                    (self.jewish_month == 3 and self.jewish_day == 6)
-                )))
+        m, d = self.jewish_month, self.jewish_day
+        if m == 7 and d == 1:
+            return True
+        if self.in_israel:
+            return False
+        return bool((self._EREV_YOM_TOV_SHENI_DAYS[m] >> d) & 1)
 
     def is_chol_hamoed(self) -> bool:
-        sd = self.significant_day()
-        return sd is not None and (sd.startswith('chol_hamoed_') or sd == 'hoshana_rabbah')
+        return self.significant_day() in self._CHOL_HAMOED_DAYS
 
     def is_taanis(self) -> bool:
-        return self.significant_day() in ['seventeen_of_tammuz', 'tisha_beav', 'tzom_gedalyah',
-                                          'yom_kippur', 'tenth_of_teves', 'taanis_esther']
+        return self.significant_day() in _TAANIYOS
 
     def is_taanis_bechorim(self) -> bool:
-        return ((self.day_of_week != 7 and self.jewish_day == 14 and self.jewish_month == 1) or
-                (self.day_of_week == 5 and self.jewish_day == 12 and self.jewish_month == 1))
+        return self.jewish_month == 1 and self._is_fast_day(_TAANIS_BECHORIM)
 
     def is_shabbos_mevorchim(self) -> bool:
-        return self.day_of_week == 7 and self.jewish_month != 6 and self.jewish_day in range(23, 30)
+        return self.day_of_week == 7 and self.jewish_month != 6 and 23 <= self.jewish_day < 30
 
     def is_rosh_chodesh(self) -> bool:
         return self.jewish_day == 30 or (self.jewish_day == 1 and self.jewish_month != 7)
@@ -131,65 +250,68 @@ class JewishCalendar(JewishDate):
         if not self.is_chanukah():
             return None
 
-        if self.jewish_month_name() == 'kislev':
+        if self.jewish_month == 9:  # kislev
             return self.jewish_day - 24
         else:
             return self.jewish_day + (5 if self.is_kislev_short() else 6)
 
     def day_of_omer(self) -> Optional[int]:
-        month_name = self.jewish_month_name()
-        if month_name == 'nissan':
+        m = self.jewish_month
+        if m == 1:  # nissan
             return self.jewish_day - 15 if self.jewish_day > 15 else None
-        elif month_name == 'iyar':
+        elif m == 2:  # iyar
             return self.jewish_day + 15
-        elif month_name == 'sivan':
+        elif m == 3:  # sivan
             return self.jewish_day + 44 if self.jewish_day < 6 else None
         else:
             return None
 
     def molad_as_datetime(self) -> datetime:
-        m = self.molad()
-        location_name = 'Jerusalem, Israel'
-        latitude = 31.778  # Har Habayis latitude
-        longitude = 35.2354  # Har Habayis longitude
-        zone = tz.gettz('Asia/Jerusalem')
-
-        geo = GeoLocation(location_name, latitude, longitude, zone)
-        seconds = m.molad_chalakim * 10 / 3.0
-        seconds, microseconds = divmod(seconds * 10**6, 10**6)
-        # molad as local mean time
-        time = datetime(m.gregorian_year, m.gregorian_month, m.gregorian_day,
-                        m.molad_hours, m.molad_minutes, int(seconds), int(microseconds),
-                        tzinfo=tz.gettz('Etc/GMT-2'))
-        # molad as Jerusalem standard time
-        micro_offset = geo.local_mean_time_offset() * 1000
-        time -= timedelta(microseconds=micro_offset)
-        # molad as UTC
-        return time.astimezone(tz.UTC)
+        if self.__molad_as_datetime is None:
+            self.__molad_as_datetime = self._calculate_molad_as_datetime()
+        return self.__molad_as_datetime
 
     def techilas_zman_kiddush_levana_3_days(self) -> datetime:
-        return self.molad_as_datetime() + timedelta(3)
+        return self.molad_as_datetime() + _THREE_DAYS
 
     def techilas_zman_kiddush_levana_7_days(self) -> datetime:
-        return self.molad_as_datetime() + timedelta(7)
+        return self.molad_as_datetime() + _SEVEN_DAYS
 
     def sof_zman_kiddush_levana_between_moldos(self) -> datetime:
-        half_molad_in_seconds = self.CHALAKIM_PER_MONTH * 10 / 6.0
-        return self.molad_as_datetime() + timedelta(microseconds=half_molad_in_seconds * 10**6)
+        return self.molad_as_datetime() + timedelta(seconds=self._HALF_MOLAD_SECONDS)
 
     def sof_zman_kiddush_levana_15_days(self) -> datetime:
-        return self.molad_as_datetime() + timedelta(15)
+        return self.molad_as_datetime() + _FIFTEEN_DAYS
+
+    def _reset_cached_values(self):
+        self.__significant_day = None
+        self.__significant_day_cached = False
+        self.__molad_as_datetime = None
+
+    def _calculate_molad_as_datetime(self) -> datetime:
+        m = self.molad()
+        # a chelek is 10/3 seconds, computed in whole microseconds
+        seconds, microseconds = divmod(m.molad_chalakim * 10 * 10**6 // 3, 10**6)
+        # molad as local mean time
+        time = datetime(m.gregorian_year, m.gregorian_month, m.gregorian_day,
+                        m.molad_hours, m.molad_minutes, seconds, microseconds,
+                        tzinfo=_JERUSALEM_STANDARD_TIME)
+        # molad as Jerusalem standard time
+        time -= _HAR_HABAYIS_LOCAL_MEAN_TIME_OFFSET
+        # molad as UTC
+        return time.astimezone(tz.UTC)
+
+    def _is_fast_day(self, fast_day_mask: int) -> bool:
+        return bool((fast_day_mask >> (self.jewish_day * 8 + self.day_of_week)) & 1)
 
     def _nissan_significant_day(self) -> Optional[str]:
-        pesach = [15, 21]
-        if not self.in_israel:
-            pesach += [16, 22]
+        pesach = self._PESACH_DAYS_IN_ISRAEL if self.in_israel else self._PESACH_DAYS
 
         if self.jewish_day == 14:
             return 'erev_pesach'
-        elif self.jewish_day in pesach:
+        elif (pesach >> self.jewish_day) & 1:
             return 'pesach'
-        elif self.jewish_day in range(16,21):
+        elif 16 <= self.jewish_day < 21:
             return 'chol_hamoed_pesach'
         elif self.use_modern_holidays:
             if (self.jewish_day == 26 and self.day_of_week == 5) \
@@ -217,23 +339,19 @@ class JewishCalendar(JewishDate):
                 return 'yom_yerushalayim'
 
     def _sivan_significant_day(self) -> Optional[str]:
-        shavuos = [6]
-        if not self.in_israel:
-            shavuos += [7]
+        shavuos = self._SHAVUOS_DAYS_IN_ISRAEL if self.in_israel else self._SHAVUOS_DAYS
 
         if self.jewish_day == 5:
             return 'erev_shavuos'
-        elif self.jewish_day in shavuos:
+        elif (shavuos >> self.jewish_day) & 1:
             return 'shavuos'
 
     def _tammuz_significant_day(self) -> Optional[str]:
-        if (self.jewish_day == 17 and self.day_of_week != 7) \
-                or (self.jewish_day == 18 and self.day_of_week == 1):
+        if self._is_fast_day(_SEVENTEEN_OF_TAMMUZ):
             return 'seventeen_of_tammuz'
 
     def _av_significant_day(self) -> Optional[str]:
-        if (self.jewish_day == 9 and self.day_of_week != 7) \
-                or (self.jewish_day == 10 and self.day_of_week == 1):
+        if self._is_fast_day(_TISHA_BEAV):
             return 'tisha_beav'
         elif self.jewish_day == 15:
             return 'tu_beav'
@@ -243,14 +361,11 @@ class JewishCalendar(JewishDate):
             return 'erev_rosh_hashana'
 
     def _tishrei_significant_day(self) -> Optional[str]:
-        succos = [15]
-        if not self.in_israel:
-            succos += [16]
+        succos = self._SUCCOS_DAYS_IN_ISRAEL if self.in_israel else self._SUCCOS_DAYS
 
         if self.jewish_day in [1, 2]:
             return 'rosh_hashana'
-        elif (self.jewish_day == 3 and self.day_of_week != 7) \
-                or (self.jewish_day == 4 and self.day_of_week == 1):
+        elif self._is_fast_day(_TZOM_GEDALYAH):
             return 'tzom_gedalyah'
         elif self.jewish_day == 9:
             return 'erev_yom_kippur'
@@ -258,9 +373,9 @@ class JewishCalendar(JewishDate):
             return 'yom_kippur'
         elif self.jewish_day == 14:
             return 'erev_succos'
-        elif self.jewish_day in succos:
+        elif (succos >> self.jewish_day) & 1:
             return 'succos'
-        elif self.jewish_day in range(16,21):
+        elif 16 <= self.jewish_day < 21:
             return 'chol_hamoed_succos'
         elif self.jewish_day == 21:
             return 'hoshana_rabbah'
@@ -277,11 +392,9 @@ class JewishCalendar(JewishDate):
             return 'chanukah'
 
     def _teves_significant_day(self) -> Optional[str]:
-        chanukah = [1,2]
-        if self.is_kislev_short():
-            chanukah += [3]
+        chanukah = self._CHANUKAH_TEVES_DAYS_AFTER_SHORT_KISLEV if self.is_kislev_short() else self._CHANUKAH_TEVES_DAYS
 
-        if self.jewish_day in chanukah:
+        if (chanukah >> self.jewish_day) & 1:
             return 'chanukah'
         elif self.jewish_day == 10:
             return 'tenth_of_teves'
@@ -303,10 +416,27 @@ class JewishCalendar(JewishDate):
         return self._purim_significant_day()
 
     def _purim_significant_day(self) -> Optional[str]:
-        if (self.jewish_day == 13 and self.day_of_week != 7) \
-                or (self.jewish_day == 11 and self.day_of_week == 5):
+        if self._is_fast_day(_TAANIS_ESTHER):
             return 'taanis_esther'
         elif self.jewish_day == 14:
             return 'purim'
         elif self.jewish_day == 15:
-            return 'shushan_purim'
\ No newline at end of file
+            return 'shushan_purim'
+
+    # names of the month-specific significant day lookups, indexed by month number; looked up by name so that
+    # subclasses can override them
+    _SIGNIFICANT_DAY_HELPERS = (None, '_nissan_significant_day', '_iyar_significant_day', '_sivan_significant_day',
+                                '_tammuz_significant_day', '_av_significant_day', '_elul_significant_day',
+                                '_tishrei_significant_day', '_cheshvan_significant_day', '_kislev_significant_day',
+                                '_teves_significant_day', '_shevat_significant_day', '_adar_significant_day',
+                                '_adar_ii_significant_day')
+
+    @classmethod
+    def _uses_significant_day_table(cls) -> bool:
+        try:
+            return _USES_SIGNIFICANT_DAY_TABLE[cls]
+        except KeyError:
+            helpers = cls._SIGNIFICANT_DAY_HELPERS[1:] + ('_purim_significant_day', '_is_fast_day')
+            uses_table = all(getattr(cls, name) is getattr(JewishCalendar, name) for name in helpers)
+            _USES_SIGNIFICANT_DAY_TABLE[cls] = uses_table
+            return uses_table
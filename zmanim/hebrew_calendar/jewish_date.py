@@ -2,6 +2,7 @@ import copy
 from datetime import timedelta
 from datetime import date as dt_date
 from enum import Enum
+from functools import lru_cache
 from memoization import cached
 from typing import Optional, Tuple
 
@@ -9,6 +10,7 @@ from typing import Optional, Tuple
 class JewishDate:
     MONTHS = Enum('Months', 'nissan iyar sivan tammuz av elul tishrei cheshvan kislev teves shevat adar adar_ii')
     MONTHS_LIST = list(MONTHS)
+    _MONTH_NAMES = tuple(m.name for m in MONTHS_LIST)
 
     RD = dt_date(1, 1, 1)
     JEWISH_EPOCH = -1373429
@@ -120,6 +122,7 @@ class JewishDate:
         self.__jewish_year = jewish_year
         self.__jewish_month = jewish_month
         self.__jewish_day = jewish_day
+        self._reset_cached_values()
 
     date = property(fset=__date)
 
@@ -192,6 +195,7 @@ class JewishDate:
         self.__jewish_year = y
         self.__jewish_month = m
         self.__jewish_day = d
+        self._reset_cached_values()
         return self
 
     def back(self, decrement: int = 1) -> 'JewishDate':
@@ -222,6 +226,7 @@ class JewishDate:
         self.__jewish_year = y
         self.__jewish_month = m
         self.__jewish_day = d
+        self._reset_cached_values()
         return self
 
     def __add__(self, addend) -> 'JewishDate':
@@ -396,7 +401,9 @@ class JewishDate:
         return self._jewish_month_name(month)
 
     def jewish_month_from_name(self, month_name: str) -> int:
-        return next(m.value for m in self.MONTHS if m.name == month_name)
+        if month_name not in self._MONTH_NAMES:
+            raise ValueError(f"invalid month name {month_name!r}")
+        return self._MONTH_NAMES.index(month_name) + 1
 
     def _set_from_molad(self, molad: int):
         gregorian_date = self._gregorian_date_from_abs_date(self._molad_to_abs_date(molad))
@@ -450,23 +457,31 @@ class JewishDate:
     def _reset_day_of_week(self):
         self.__day_of_week = (self.gregorian_date.isoweekday() % 7) + 1
 
+    # hook for subclasses to discard any values derived from the current date
+    def _reset_cached_values(self):
+        pass
+
     @staticmethod
     def _jewish_month_name(month: int) -> str:
-        return JewishDate.MONTHS_LIST[month - 1].name
+        return JewishDate._MONTH_NAMES[month - 1]
 
     @staticmethod
+    @lru_cache(maxsize=8192)
     def _is_jewish_leap_year(year: int) -> bool:
         return ((7 * year) + 1) % 19 < 7
 
     @staticmethod
+    @lru_cache(maxsize=8192)
     def _is_cheshvan_long(year: int) -> bool:
         return JewishDate._days_in_jewish_year(year) % 10 == 5
 
     @staticmethod
+    @lru_cache(maxsize=8192)
     def _is_kislev_short(year: int) -> bool:
         return JewishDate._days_in_jewish_year(year) % 10 == 3
 
     @staticmethod
+    @lru_cache(maxsize=8192)
     def _months_in_jewish_year(year: int) -> int:
         return 13 if JewishDate._is_jewish_leap_year(year) else 12
 
@@ -60,8 +60,13 @@ class NOAACalculator(AstronomicalCalculations):
         return self._approximate_utc_sun_position(trefinement, latitude, longitude, zenith, mode)
 
     def _approximate_utc_sun_position(self, approx_julian_centuries: float, latitude: float, longitude: float, zenith: float, mode: str) -> float:
-        eq_time = self._equation_of_time(approx_julian_centuries)
-        solar_dec = self._solar_declination(approx_julian_centuries)
+        # the equation of time and the solar declination share these terms, so only compute them once
+        obliquity_correction = self._obliquity_correction(approx_julian_centuries)
+        mean_longitude = self._sun_geometric_mean_longitude(approx_julian_centuries)
+        mean_anomaly = self._sun_geometric_mean_anomaly(approx_julian_centuries)
+
+        eq_time = self._equation_of_time(approx_julian_centuries, obliquity_correction, mean_longitude, mean_anomaly)
+        solar_dec = self._solar_declination(approx_julian_centuries, obliquity_correction, mean_longitude, mean_anomaly)
         hour_angle = self._sun_hour_angle_at_horizon(latitude, solar_dec, zenith, mode)
 
         delta = longitude - math.degrees(hour_angle)
@@ -83,24 +88,31 @@ class NOAACalculator(AstronomicalCalculations):
 
         return hour_angle  # in radians
 
-    def _solar_declination(self, julian_centuries: float) -> float:
-        correction = math.radians(self._obliquity_correction(julian_centuries))
-        apparent_longitude = math.radians(self._sun_apparent_longitude(julian_centuries))
+    def _solar_declination(self, julian_centuries: float, obliquity_correction: Optional[float] = None,
+                           mean_longitude: Optional[float] = None, mean_anomaly: Optional[float] = None) -> float:
+        if obliquity_correction is None:
+            obliquity_correction = self._obliquity_correction(julian_centuries)
+        correction = math.radians(obliquity_correction)
+        apparent_longitude = math.radians(self._sun_apparent_longitude(julian_centuries, mean_longitude, mean_anomaly))
         sint = math.sin(correction) * math.sin(apparent_longitude)
         return math.degrees(math.asin(sint))  # in degrees
 
-    def _sun_apparent_longitude(self, julian_centuries: float) -> float:
-        true_longitude = self._sun_true_longitude(julian_centuries)
+    def _sun_apparent_longitude(self, julian_centuries: float, mean_longitude: Optional[float] = None,
+                                mean_anomaly: Optional[float] = None) -> float:
+        true_longitude = self._sun_true_longitude(julian_centuries, mean_longitude, mean_anomaly)
         omega = 125.04 - (1934.136 * julian_centuries)
         return true_longitude - 0.00569 - (0.00478 * math.sin(math.radians(omega)))  # in degrees
 
-    def _sun_true_longitude(self, julian_centuries: float) -> float:
-        sgml = self._sun_geometric_mean_longitude(julian_centuries)
-        center = self._sun_equation_of_center(julian_centuries)
+    def _sun_true_longitude(self, julian_centuries: float, mean_longitude: Optional[float] = None,
+                            mean_anomaly: Optional[float] = None) -> float:
+        sgml = self._sun_geometric_mean_longitude(julian_centuries) if mean_longitude is None else mean_longitude
+        center = self._sun_equation_of_center(julian_centuries, mean_anomaly)
         return sgml + center  # in degrees
 
-    def _sun_equation_of_center(self, julian_centuries: float) -> float:
-        mrad = math.radians(self._sun_geometric_mean_anomaly(julian_centuries))
+    def _sun_equation_of_center(self, julian_centuries: float, mean_anomaly: Optional[float] = None) -> float:
+        if mean_anomaly is None:
+            mean_anomaly = self._sun_geometric_mean_anomaly(julian_centuries)
+        mrad = math.radians(mean_anomaly)
         sinm = math.sin(mrad)
         sin2m = math.sin(2 * mrad)
         sin3m = math.sin(3 * mrad)
@@ -122,10 +134,17 @@ class NOAACalculator(AstronomicalCalculations):
         eq_time = self._equation_of_time(tnoon)
         return 720 + (longitude * 4) - eq_time
 
-    def _equation_of_time(self, julian_centuries: float) -> float:
-        epsilon = math.radians(self._obliquity_correction(julian_centuries))
-        sgml = math.radians(self._sun_geometric_mean_longitude(julian_centuries))
-        sgma = math.radians(self._sun_geometric_mean_anomaly(julian_centuries))
+    def _equation_of_time(self, julian_centuries: float, obliquity_correction: Optional[float] = None,
+                          mean_longitude: Optional[float] = None, mean_anomaly: Optional[float] = None) -> float:
+        if obliquity_correction is None:
+            obliquity_correction = self._obliquity_correction(julian_centuries)
+        if mean_longitude is None:
+            mean_longitude = self._sun_geometric_mean_longitude(julian_centuries)
+        if mean_anomaly is None:
+            mean_anomaly = self._sun_geometric_mean_anomaly(julian_centuries)
+        epsilon = math.radians(obliquity_correction)
+        sgml = math.radians(mean_longitude)
+        sgma = math.radians(mean_anomaly)
         eoe = self._earth_orbit_eccentricity(julian_centuries)
 
         y = math.tan(epsilon / 2.0)
@@ -1,11 +1,16 @@
-from datetime import datetime, timedelta
-from typing import Optional
+from datetime import date, datetime, timedelta
+from typing import Iterable, Optional
 
 from zmanim.astronomical_calendar import AstronomicalCalendar
 from zmanim.hebrew_calendar.jewish_calendar import JewishCalendar
+from zmanim.util.geo_location import GeoLocation
 
 
 class ZmanimCalendar(AstronomicalCalendar):
+    # zeniths for the default tzais (8.5 degrees) and alos (16.1 degrees) used when no opts are given
+    _TZAIS_DEFAULT_ZENITH = AstronomicalCalendar.GEOMETRIC_ZENITH + 8.5
+    _ALOS_DEFAULT_ZENITH = AstronomicalCalendar.GEOMETRIC_ZENITH + 16.1
+
     def __init__(self, candle_lighting_offset: Optional[int] = None, *args, **kwargs):
         super(ZmanimCalendar, self).__init__(*args, **kwargs)
         self.candle_lighting_offset = 18 if candle_lighting_offset is None else candle_lighting_offset
@@ -16,6 +21,23 @@ class ZmanimCalendar(AstronomicalCalendar):
                (self.__module__ + "." + self.__class__.__qualname__, self.candle_lighting_offset,
                 self.geo_location, self.date, self.astronomical_calculator)
 
+    # Returns the requested zmanim for each date, reusing a single calendar across the whole range
+    #   ZmanimCalendar.compute_zmanim_range([date(2017, 10, 17), date(2017, 10, 18)], geo_location, ['hanetz', 'shkia'])
+    #   => {'hanetz': [<datetime>, <datetime>], 'shkia': [<datetime>, <datetime>]}
+    @classmethod
+    def compute_zmanim_range(cls, dates: Iterable[date], geo_location: GeoLocation,
+                             which: Iterable[str] = ('hanetz', 'shkia', 'candle_lighting'),
+                             candle_lighting_offset: Optional[int] = None, use_elevation: bool = False) -> dict:
+        calendar = cls(candle_lighting_offset, geo_location=geo_location)
+        calendar.use_elevation = use_elevation
+        zmanim = [(name, getattr(calendar, name)) for name in which]
+        results = {name: [] for name, _ in zmanim}
+        for day in dates:
+            calendar.date = day
+            for name, zman in zmanim:
+                results[name].append(zman())
+        return results
+
     def elevation_adjusted_sunrise(self) -> Optional[datetime]:
         return self.sunrise() if self.use_elevation else self.sea_level_sunrise()
 
@@ -28,18 +50,27 @@ class ZmanimCalendar(AstronomicalCalendar):
     def shkia(self) -> Optional[datetime]:
         return self.elevation_adjusted_sunset()
 
-    def tzais(self, opts: dict = {'degrees': 8.5}) -> Optional[datetime]:
+    # opts defaults to {'degrees': 8.5}
+    def tzais(self, opts: Optional[dict] = None) -> Optional[datetime]:
+        if opts is None:
+            return self.sunset_offset_by_degrees(self._TZAIS_DEFAULT_ZENITH)
         degrees, offset, zmanis_offset = self._extract_degrees_offset(opts)
-        sunset_for_degrees = self.elevation_adjusted_sunset() if degrees == 0 else self.sunset_offset_by_degrees(self.GEOMETRIC_ZENITH + degrees)
+        if degrees == 0:
+            sunset_for_degrees = self.elevation_adjusted_sunset()
+        else:
+            sunset_for_degrees = self.sunset_offset_by_degrees(self.GEOMETRIC_ZENITH + degrees)
         if zmanis_offset != 0:
             return self._offset_by_minutes_zmanis(sunset_for_degrees, zmanis_offset)
         else:
             return self._offset_by_minutes(sunset_for_degrees, offset)
 
     def tzais_72(self) -> Optional[datetime]:
-        return self.tzais({'offset': 72})
+        return self._tzais_offset_minutes(72)
 
-    def alos(self, opts: dict = {'degrees': 16.1}) -> Optional[datetime]:
+    # opts defaults to {'degrees': 16.1}
+    def alos(self, opts: Optional[dict] = None) -> Optional[datetime]:
+        if opts is None:
+            return self.sunrise_offset_by_degrees(self._ALOS_DEFAULT_ZENITH)
         degrees, offset, zmanis_offset = self._extract_degrees_offset(opts)
         sunrise_for_degrees = self.elevation_adjusted_sunrise() if degrees == 0 else self.sunrise_offset_by_degrees(self.GEOMETRIC_ZENITH + degrees)
         if zmanis_offset != 0:
@@ -48,7 +79,7 @@ class ZmanimCalendar(AstronomicalCalendar):
             return self._offset_by_minutes(sunrise_for_degrees, -offset)
 
     def alos_72(self) -> Optional[datetime]:
-        return self.alos({'offset': 72})
+        return self._alos_offset_minutes(72)
 
     def chatzos(self) -> Optional[datetime]:
         return self.sun_transit()
@@ -60,29 +91,23 @@ class ZmanimCalendar(AstronomicalCalendar):
         return self._shaos_into_day(day_start, day_end, 3)
 
     def sof_zman_shma_gra(self) -> Optional[datetime]:
-        elevation_adjusted_sunrise = self.elevation_adjusted_sunrise()
-        elevation_adjusted_sunset = self.elevation_adjusted_sunset()
-        if elevation_adjusted_sunrise is None or elevation_adjusted_sunset is None:
-            return None
-        return self.sof_zman_shma(elevation_adjusted_sunrise, elevation_adjusted_sunset)
+        return self._zmanim_of_day()['sof_zman_shma_gra']
 
     def sof_zman_shma_mga(self) -> Optional[datetime]:
-        alos_72 = self.alos_72()
-        tzais_72 = self.tzais_72()
-        if alos_72 is None or tzais_72 is None:
-            return None
-        return self.sof_zman_shma(alos_72, tzais_72)
+        return self._shaos_into_day(self.alos_72(), self.tzais_72(), 3)
 
     def sof_zman_tfila(self, day_start: Optional[datetime], day_end: Optional[datetime]) -> Optional[datetime]:
         return self._shaos_into_day(day_start, day_end, 4)
 
     def sof_zman_tfila_gra(self) -> Optional[datetime]:
-        return self.sof_zman_tfila(self.elevation_adjusted_sunrise(), self.elevation_adjusted_sunset())
+        return self._zmanim_of_day()['sof_zman_tfila_gra']
 
     def sof_zman_tfila_mga(self) -> Optional[datetime]:
-        return self.sof_zman_tfila(self.alos_72(), self.tzais_72())
+        return self._shaos_into_day(self.alos_72(), self.tzais_72(), 4)
 
     def mincha_gedola(self, day_start: Optional[datetime] = None, day_end: Optional[datetime] = None) -> Optional[datetime]:
+        if day_start is None and day_end is None:
+            return self._zmanim_of_day()['mincha_gedola']
         if day_start is None:
             day_start = self.elevation_adjusted_sunrise()
         if day_end is None:
@@ -91,6 +116,8 @@ class ZmanimCalendar(AstronomicalCalendar):
         return self._shaos_into_day(day_start, day_end, 6.5)
 
     def mincha_ketana(self, day_start: Optional[datetime] = None, day_end: Optional[datetime] = None) -> Optional[datetime]:
+        if day_start is None and day_end is None:
+            return self._zmanim_of_day()['mincha_ketana']
         if day_start is None:
             day_start = self.elevation_adjusted_sunrise()
         if day_end is None:
@@ -99,6 +126,8 @@ class ZmanimCalendar(AstronomicalCalendar):
         return self._shaos_into_day(day_start, day_end, 9.5)
 
     def plag_hamincha(self, day_start: Optional[datetime] = None, day_end: Optional[datetime] = None) -> Optional[datetime]:
+        if day_start is None and day_end is None:
+            return self._zmanim_of_day()['plag_hamincha']
         if day_start is None:
             day_start = self.elevation_adjusted_sunrise()
         if day_end is None:
@@ -106,6 +135,10 @@ class ZmanimCalendar(AstronomicalCalendar):
 
         return self._shaos_into_day(day_start, day_end, 10.75)
 
+    # Returns the sof zman shma/tfila and mincha zmanim according to the GRA, all derived from a single sunrise/sunset
+    def zmanim_of_day(self) -> dict:
+        return dict(self._zmanim_of_day())
+
     def shaah_zmanis(self, day_start: Optional[datetime], day_end: Optional[datetime]) -> Optional[float]:
         return self.temporal_hour(day_start, day_end)
 
@@ -133,23 +166,41 @@ class ZmanimCalendar(AstronomicalCalendar):
         elevation_adjusted_sunset = self.elevation_adjusted_sunset()
         if elevation_adjusted_sunset is None:
             return None
-        
-        jewish_calendar = JewishCalendar(current_time.date())
-        jewish_calendar.in_israel = in_israel
-        return (current_time <= tzais_time and jewish_calendar.is_assur_bemelacha()) or \
-               (current_time >= elevation_adjusted_sunset and jewish_calendar.is_tomorrow_assur_bemelacha())
+
+        assur_bemelacha, tomorrow_assur_bemelacha = JewishCalendar.assur_bemelacha_pair(current_time.date(), bool(in_israel))
+        return (current_time <= tzais_time and assur_bemelacha) or \
+               (current_time >= elevation_adjusted_sunset and tomorrow_assur_bemelacha)
+
+    _SHAOS_OF_DAY = (('sof_zman_shma_gra', 3), ('sof_zman_tfila_gra', 4),
+                     ('mincha_gedola', 6.5), ('mincha_ketana', 9.5), ('plag_hamincha', 10.75))
+
+    def _zmanim_of_day(self) -> dict:
+        cache = self._solar_cache()
+        key = ('zmanim_of_day', self.use_elevation)
+        if key not in cache:
+            sunrise = self.elevation_adjusted_sunrise()
+            sunset = self.elevation_adjusted_sunset()
+            if sunrise is None or sunset is None:
+                cache[key] = {name: None for name, _ in self._SHAOS_OF_DAY}
+            else:
+                day_length = sunset - sunrise
+                cache[key] = {name: sunrise + day_length * (shaos / 12.0) for name, shaos in self._SHAOS_OF_DAY}
+        return cache[key]
 
     def _shaos_into_day(self, day_start: Optional[datetime], day_end: Optional[datetime], shaos: float) -> Optional[datetime]:
-        shaah_zmanis = self.temporal_hour(day_start, day_end)
-        if shaah_zmanis is None:
+        if day_start is None or day_end is None:
             return None
-        return self._offset_by_minutes(day_start, (shaah_zmanis / self.MINUTE_MILLIS) * shaos)
+        return day_start + (day_end - day_start) * (shaos / 12.0)
 
     def _extract_degrees_offset(self, opts: dict) -> tuple:
-        degrees = opts['degrees'] if 'degrees' in opts else 0
-        offset = opts['offset'] if 'offset' in opts else 0
-        zmanis_offset = opts['zmanis_offset'] if 'zmanis_offset' in opts else 0
-        return degrees, offset, zmanis_offset
+        return opts.get('degrees', 0), opts.get('offset', 0), opts.get('zmanis_offset', 0)
+
+    # equivalent to tzais({'offset': minutes}) / alos({'offset': minutes}), without the opts handling
+    def _tzais_offset_minutes(self, minutes: float) -> Optional[datetime]:
+        return self._offset_by_minutes(self.elevation_adjusted_sunset(), minutes)
+
+    def _alos_offset_minutes(self, minutes: float) -> Optional[datetime]:
+        return self._offset_by_minutes(self.elevation_adjusted_sunrise(), -minutes)
 
     def _offset_by_minutes(self, time: Optional[datetime], minutes: float) -> Optional[datetime]:
         if time is None:
@@ -159,8 +210,13 @@ class ZmanimCalendar(AstronomicalCalendar):
     def _offset_by_minutes_zmanis(self, time: Optional[datetime], minutes: float) -> Optional[datetime]:
         if time is None:
             return None
-        shaah_zmanis_gra = self.shaah_zmanis_gra()
-        if shaah_zmanis_gra is None:
+        # the skew only depends on the day's sunrise and sunset, so keep it alongside the cached sun times
+        cache = self._solar_cache()
+        key = ('shaah_zmanis_skew', self.use_elevation)
+        if key not in cache:
+            shaah_zmanis_gra = self.shaah_zmanis_gra()
+            cache[key] = None if shaah_zmanis_gra is None else shaah_zmanis_gra / self.HOUR_MILLIS
+        shaah_zmanis_skew = cache[key]
+        if shaah_zmanis_skew is None:
             return None
-        shaah_zmanis_skew = shaah_zmanis_gra / self.HOUR_MILLIS
         return time + timedelta(minutes=minutes*shaah_zmanis_skew)